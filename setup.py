@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Optional Cython build of the data processor for CPython deployments.
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Compiles src/data_processor.py as-is (Cython pure-Python mode, using its
+str/tuple annotations) into src/data_processor.*.so, which Python imports in
+preference to the .py source. Delete the .so to fall back to pure Python.
+Cython is not a declared build requirement: when it is not installed the
+extension is skipped and only the pure-Python modules are built/installed.
+"""
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    print("Cython not installed; skipping the compiled data_processor extension")
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("data_processor", ["src/data_processor.py"])],
+        compiler_directives={
+            "language_level": "3str",
+            "boundscheck": False,
+            # wraparound stays on: validators index with [-1]
+        },
+    )
+
+setup(
+    name="inventory-data-processor",
+    package_dir={"": "src"},
+    # data_processor.py is shipped too, as the fallback when no extension is built
+    py_modules=["data_processor", "run_ipv4_validation", "_ipfast", "run"],
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Fast IPv4 parsing for the per-row hot path.
+JIT-compiled with Numba when it is installed; plain Python otherwise.
+"""
+import platform
+
+try:
+    # Numba is CPython-only; under PyPy the tracing JIT handles this loop itself
+    if platform.python_implementation() != "CPython":
+        raise ImportError("numba requires CPython")
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is unavailable."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def parse_ipv4(s):
+    """
+    Parse a dotted-quad IPv4 string of plain ASCII digits.
+    Returns: (is_valid, a, b, c, d)
+    Stricter than ipv4_validate_and_normalize (no whitespace, signs or
+    non-ASCII digits), so callers fall back to it when this rejects.
+    """
+    a = 0
+    b = 0
+    c = 0
+    part = 0
+    value = 0
+    digits = 0
+    for i in range(len(s)):
+        ch = ord(s[i])
+        if ch == 46:  # '.'
+            if digits == 0 or part == 3:
+                return (False, 0, 0, 0, 0)
+            if part == 0:
+                a = value
+            elif part == 1:
+                b = value
+            else:
+                c = value
+            part += 1
+            value = 0
+            digits = 0
+        elif 48 <= ch <= 57:
+            value = value * 10 + (ch - 48)
+            digits += 1
+            if value > 255:
+                return (False, 0, 0, 0, 0)
+        else:
+            return (False, 0, 0, 0, 0)
+    if part != 3 or digits == 0:
+        return (False, 0, 0, 0, 0)
+    return (True, a, b, c, value)
+
+
+# Warm the JIT (or on-disk cache) so the first row does not pay for compilation
+parse_ipv4("0.0.0.0")
@@ -5,107 +5,206 @@ Uses deterministic rules first, LLM only where rules are insufficient.
 """
 import csv
 import json
+import os
+import queue
 import re
 import sys
+import threading
+from functools import lru_cache
+from collections import deque
+from itertools import chain, islice
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Tuple, Optional, Dict, List
+from typing import Tuple, Optional, Dict, List, Iterator
 
 # Import IPv4 validation from existing module
 from run_ipv4_validation import ipv4_validate_and_normalize, default_subnet, classify_ipv4_type
 
+# Boolean output cells
+_TRUE, _FALSE = "true", "false"
 
-def hostname_validate(hostname: str) -> Tuple[bool, str, str]:
+# Rows per unit of work handed to the process pool
+_CHUNK_ROWS = 2048
+
+# Chunks the background reader may parse ahead of processing
+_READ_AHEAD = 4
+
+# Buffer size for the input/output files (fewer read/write syscalls)
+_IO_BUFFER = 1 << 20
+
+# Memo size for the per-field normalizers; inventory columns repeat heavily
+_CACHE_SIZE = 16384
+
+# Bytes permitted in a hostname/FQDN (RFC 1123): alphanumeric, hyphen, dot
+_HOSTNAME_CHARS = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-.'
+
+# Deletes the separators accepted in MAC addresses
+_MAC_STRIP = str.maketrans('', '', '-:.')
+
+# Precompiled patterns used by the per-row validators
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_TEAM_KW_RE = re.compile(r'\b(?:platform|ops|sec|facilities|infrastructure|network|security)\b', re.IGNORECASE)
+_WORD_SPLIT_RE = re.compile(r'\W+')
+_SITE_SPLIT_RE = re.compile(r'[\s\-]+')
+# Digits and punctuation both separate tokens so "host03" / "iot-cam01" still match
+_TOKEN_SPLIT_RE = re.compile(r'[^a-z]+')
+
+# Words recognised as a team when no "(team)" group is present
+_TEAM_KEYWORDS = frozenset({
+    'platform', 'ops', 'sec', 'facilities', 'infrastructure', 'network', 'security',
+})
+# Substrings covering every team keyword, for a cheap pre-check
+_TEAM_QUICK = ('platform', 'ops', 'sec', 'facilities', 'infrastructure', 'network')
+
+# Site placeholders treated as empty, and canonical spellings of site words
+_SITE_EMPTY = frozenset({'n/a', 'na', 'none'})
+_SITE_TOKEN_MAP = {
+    'bldg': 'Building',
+    'building': 'Building',
+    'camp': 'Campus',
+    'campus': 'Campus',
+    'hq': 'HQ',
+    'headquarters': 'HQ',
+}
+
+# Device type keywords and their canonical type
+_TYPE_MAPPING = {
+    'server': 'server',
+    'srv': 'server',
+    'host': 'server',
+    'switch': 'switch',
+    'sw': 'switch',
+    'router': 'router',
+    'gw': 'router',
+    'gateway': 'router',
+    'printer': 'printer',
+    'print': 'printer',
+    'iot': 'iot',
+    'camera': 'iot',
+    'cam': 'iot',
+    'dns': 'dns',
+    'nameserver': 'dns',
+}
+# Precedence when hostname/notes mention more than one device type
+_TYPE_PRIORITY = ('server', 'switch', 'router', 'printer', 'iot', 'dns')
+
+
+def _validate_dns_name(name: Optional[str], require_fqdn: bool) -> Tuple[bool, str, str, int]:
     """
-    Validate hostname according to RFC 1123.
-    Returns: (is_valid, normalized_hostname, reason)
+    Validate a hostname or FQDN according to RFC 1123 in a single pass.
+    With require_fqdn, names without a dot are rejected as "not_fqdn".
+    Returns: (is_valid, normalized_name, reason, label_count)
     """
-    if not hostname or hostname.strip() == "":
-        return (False, "", "missing")
+    if not name or name.strip() == "":
+        return (False, "", "missing", 0)
     
-    hostname = hostname.strip()
+    name = name.strip()
     
-    # Basic length check
-    if len(hostname) > 253:
-        return (False, hostname, "too_long")
+    # FQDNs must have at least one dot
+    if require_fqdn and '.' not in name:
+        return (False, name, "not_fqdn", 1)
     
-    # Check for valid characters: alphanumeric, hyphen, dot
-    if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]{0,61}[a-zA-Z0-9])?$', hostname):
-        return (False, hostname, "invalid_chars")
+    # Basic length check
+    if len(name) > 253:
+        return (False, name, "too_long", 0)
+    
+    # Check for valid characters: alphanumeric, hyphen, dot; must start and
+    # end alphanumeric. translate() deletes every allowed byte, so anything
+    # left over is an invalid character.
+    if (not name.isascii()
+            or name.encode('ascii').translate(None, _HOSTNAME_CHARS)
+            or not name[0].isalnum()
+            or not name[-1].isalnum()):
+        return (False, name, "invalid_chars", 0)
     
     # Check labels (parts separated by dots)
-    labels = hostname.split('.')
+    labels = name.split('.')
     for label in labels:
         if len(label) > 63:
-            return (False, hostname, "label_too_long")
+            return (False, name, "label_too_long", len(labels))
         if len(label) == 0:
-            return (False, hostname, "empty_label")
+            return (False, name, "empty_label", len(labels))
         if label.startswith('-') or label.endswith('-'):
-            return (False, hostname, "invalid_label_format")
+            return (False, name, "invalid_label_format", len(labels))
     
-    return (True, hostname.lower(), "ok")
+    return (True, name.lower(), "ok", len(labels))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def hostname_validate(hostname: Optional[str]) -> Tuple[bool, str, str]:
+    """
+    Validate hostname according to RFC 1123.
+    Returns: (is_valid, normalized_hostname, reason)
+    """
+    valid, normalized, reason, _ = _validate_dns_name(hostname, False)
+    return (valid, normalized, reason)
 
 
-def fqdn_validate(fqdn: str) -> Tuple[bool, str, str]:
+@lru_cache(maxsize=_CACHE_SIZE)
+def fqdn_validate(fqdn: Optional[str]) -> Tuple[bool, str, str]:
     """
     Validate FQDN (Fully Qualified Domain Name).
     Returns: (is_valid, normalized_fqdn, reason)
     """
-    if not fqdn or fqdn.strip() == "":
-        return (False, "", "missing")
-    
-    fqdn = fqdn.strip()
-    
-    # Must end with a dot or have at least one dot
-    if '.' not in fqdn:
-        return (False, fqdn, "not_fqdn")
-    
-    # Use hostname validation but require at least one dot
-    valid, normalized, reason = hostname_validate(fqdn)
-    if not valid:
-        return (valid, fqdn, reason)
+    valid, normalized, reason, label_count = _validate_dns_name(fqdn, True)
     
     # Ensure it has a TLD (at least 2 labels)
-    labels = normalized.split('.')
-    if len(labels) < 2:
-        return (False, fqdn, "missing_tld")
+    if valid and label_count < 2:
+        return (False, fqdn.strip(), "missing_tld")
     
-    return (True, normalized, "ok")
+    return (valid, normalized, reason)
 
 
-def fqdn_consistent(hostname: str, fqdn: str, ip: str) -> bool:
+def fqdn_consistent(hostname_norm: Optional[str], fqdn_norm: Optional[str]) -> bool:
     """
     Check if hostname is consistent with FQDN.
-    Returns True if hostname matches the first part of FQDN.
+    Expects the normalized (stripped, lower-cased) outputs of hostname_validate
+    and fqdn_validate. Returns True if hostname matches the first part of FQDN.
     """
-    if not hostname or not fqdn:
+    if not hostname_norm or not fqdn_norm:
         return False
     
-    hostname_lower = hostname.strip().lower()
-    fqdn_lower = fqdn.strip().lower()
-    
     # Check if hostname matches the first label of FQDN
-    fqdn_first_label = fqdn_lower.split('.')[0] if '.' in fqdn_lower else fqdn_lower
-    return hostname_lower == fqdn_first_label
+    dot = fqdn_norm.find('.')
+    return fqdn_norm[:dot] == hostname_norm if dot >= 0 else fqdn_norm == hostname_norm
 
 
-def reverse_ptr_generate(ip: str) -> str:
+def reverse_ptr_from_canonical(canonical_ip: str) -> str:
     """
-    Generate reverse PTR record for IPv4 address.
+    Generate reverse PTR record for an already validated, canonical IPv4 address.
+    Example: 192.168.1.1 -> 1.1.168.192.in-addr.arpa
+    """
+    a, b, c, d = canonical_ip.split('.')
+    return f"{d}.{c}.{b}.{a}.in-addr.arpa"
+
+
+def reverse_ptr_generate(ip: Optional[str]) -> str:
+    """
+    Generate reverse PTR record for an arbitrary (unvalidated) IPv4 address.
+    Deprecated: validate first and use reverse_ptr_from_canonical().
     Example: 192.168.1.1 -> 1.1.168.192.in-addr.arpa
     """
     if not ip:
         return ""
     
+    # Imported lazily: the pipeline itself never needs it, so plain imports of
+    # this module (and pool workers) skip Numba's import and JIT warm-up
+    from _ipfast import parse_ipv4
+    
+    # Fast path: plain dotted-quad parsed straight into octets
+    valid, a, b, c, d = parse_ipv4(ip)
+    if valid:
+        return f"{d}.{c}.{b}.{a}.in-addr.arpa"
+    
     valid, canonical, _ = ipv4_validate_and_normalize(ip)
     if not valid:
         return ""
     
-    parts = canonical.split('.')
-    parts.reverse()
-    return '.'.join(parts) + '.in-addr.arpa'
+    return reverse_ptr_from_canonical(canonical)
 
 
-def mac_validate_and_normalize(mac: str) -> Tuple[bool, str, str]:
+@lru_cache(maxsize=_CACHE_SIZE)
+def mac_validate_and_normalize(mac: Optional[str]) -> Tuple[bool, str, str]:
     """
     Validate and normalize MAC address.
     Accepts formats: XX:XX:XX:XX:XX:XX, XX-XX-XX-XX-XX-XX, XXXX.XXXX.XXXX
@@ -116,27 +215,35 @@ def mac_validate_and_normalize(mac: str) -> Tuple[bool, str, str]:
     
     mac = mac.strip()
     
-    # Remove common separators and convert to uppercase
-    mac_clean = re.sub(r'[-:.]', '', mac)
+    # Remove common separators
+    mac_clean = mac.translate(_MAC_STRIP)
     
     # Check length (should be 12 hex characters)
     if len(mac_clean) != 12:
         return (False, mac, "wrong_length")
     
-    # Check if all characters are hexadecimal
-    if not re.match(r'^[0-9A-Fa-f]{12}$', mac_clean):
+    # Check if all characters are hexadecimal. int() alone would also accept
+    # a sign, "_" separators, a "0x" prefix and non-ASCII digits, so rule
+    # those out first.
+    if not (mac_clean.isascii() and mac_clean.isalnum()) or mac_clean[1] in 'xX':
+        return (False, mac, "invalid_chars")
+    try:
+        int(mac_clean, 16)
+    except ValueError:
         return (False, mac, "invalid_chars")
     
     # Normalize to XX:XX:XX:XX:XX:XX format
-    normalized = ':'.join([mac_clean[i:i+2].upper() for i in range(0, 12, 2)])
+    mac_clean = mac_clean.upper()
+    normalized = (f"{mac_clean[0:2]}:{mac_clean[2:4]}:{mac_clean[4:6]}:"
+                  f"{mac_clean[6:8]}:{mac_clean[8:10]}:{mac_clean[10:12]}")
     
     return (True, normalized, "ok")
 
 
-def owner_parse(owner: str) -> Tuple[str, str, str]:
+def owner_parse(owner: Optional[str]) -> Tuple[str, str, str]:
     """
     Parse owner field to extract owner name, email, and team.
-    Uses regex patterns to extract email and team information.
+    Email via regex; team from the first "(team)" group or a known team keyword.
     Returns: (owner_name, owner_email, owner_team)
     """
     if not owner or owner.strip() == "":
@@ -147,143 +254,375 @@ def owner_parse(owner: str) -> Tuple[str, str, str]:
     team = ""
     owner_name = owner
     
-    # Extract email using regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, owner)
-    if email_match:
-        email = email_match.group(0).lower()
-        # Remove email from owner string
-        owner_name = re.sub(email_pattern, '', owner).strip()
-    
-    # Extract team from parentheses or common patterns
-    team_patterns = [
-        r'\(([^)]+)\)',  # (team)
-        r'\b(platform|ops|sec|facilities|infrastructure|network|security)\b',
-    ]
-    
-    for pattern in team_patterns:
-        match = re.search(pattern, owner_name, re.IGNORECASE)
-        if match:
-            team = match.group(1) if match.lastindex else match.group(0)
-            team = team.lower()
-            # Remove team from owner name
-            owner_name = re.sub(pattern, '', owner_name, flags=re.IGNORECASE).strip()
+    # Extract email using regex (only worth running when there is an '@')
+    if '@' in owner:
+        email_match = _EMAIL_RE.search(owner)
+        if email_match:
+            email = email_match.group(0).lower()
+            # Remove every email from owner string
+            owner_name = _EMAIL_RE.sub('', owner)
+    
+    # Extract team from the first non-empty "(...)" group; empty "()" is skipped
+    lp = owner_name.find('(')
+    rp = -1
+    while lp >= 0:
+        rp = owner_name.find(')', lp + 1)
+        if rp != lp + 1:
             break
-    
-    # Clean up owner name (remove extra spaces, parentheses)
-    owner_name = re.sub(r'\s+', ' ', owner_name).strip()
-    owner_name = re.sub(r'[()]', '', owner_name).strip()
+        lp = owner_name.find('(', lp + 1)
+    if lp >= 0 and rp > lp + 1:
+        team = owner_name[lp + 1:rp].lower()
+        owner_name = owner_name[:lp] + owner_name[rp + 1:]
+    else:
+        # Otherwise take the first team keyword (a whole word, so "ops." and
+        # "ops-team" count) and drop all of them from the name
+        owner_lower = owner_name.lower()
+        if any(k in owner_lower for k in _TEAM_QUICK):
+            for token in _WORD_SPLIT_RE.split(owner_lower):
+                if token in _TEAM_KEYWORDS:
+                    team = token
+                    owner_name = _TEAM_KW_RE.sub('', owner_name)
+                    break
+    
+    # Clean up owner name (remove parentheses, extra spaces)
+    owner_name = ' '.join(owner_name.replace('(', '').replace(')', '').split())
     
     return (owner_name, email, team)
 
 
-def device_type_classify(device_type: str, hostname: str = "", notes: str = "") -> Tuple[str, str]:
+@lru_cache(maxsize=_CACHE_SIZE)
+def device_type_classify(device_type: Optional[str], hostname: Optional[str] = "",
+                         notes: Optional[str] = "") -> Tuple[str, str]:
     """
     Classify device type using rules first, LLM only for ambiguous cases.
-    Returns: (device_type, confidence)
+    Returns: (device_type, confidence); device_type is interned
     Confidence: "high" (rules), "medium" (heuristics), "low" (needs LLM but not implemented)
     """
     if not device_type or device_type.strip() == "":
-        # Try to infer from hostname or notes
+        # Try to infer from hostname or notes; when several types are mentioned
+        # the highest-priority one wins (server > switch > router > ...)
         combined = f"{hostname} {notes}".lower()
-        
-        # Heuristic-based classification
-        if any(word in combined for word in ['server', 'srv', 'host']):
-            return ("server", "medium")
-        elif any(word in combined for word in ['switch', 'sw']):
-            return ("switch", "medium")
-        elif any(word in combined for word in ['router', 'gw', 'gateway']):
-            return ("router", "medium")
-        elif any(word in combined for word in ['printer', 'print']):
-            return ("printer", "medium")
-        elif any(word in combined for word in ['camera', 'cam', 'iot']):
-            return ("iot", "medium")
-        elif any(word in combined for word in ['dns', 'nameserver']):
-            return ("dns", "medium")
-        else:
-            return ("unknown", "low")
-    
-    device_type = device_type.strip().lower()
+        found = {_TYPE_MAPPING.get(token) for token in _TOKEN_SPLIT_RE.split(combined)}
+        for inferred in _TYPE_PRIORITY:
+            if inferred in found:
+                return (inferred, "medium")
+        return ("unknown", "low")
     
     # Normalize common variations
-    type_mapping = {
-        'server': 'server',
-        'srv': 'server',
-        'host': 'server',
-        'switch': 'switch',
-        'sw': 'switch',
-        'router': 'router',
-        'gw': 'router',
-        'gateway': 'router',
-        'printer': 'printer',
-        'print': 'printer',
-        'iot': 'iot',
-        'camera': 'iot',
-        'cam': 'iot',
-        'dns': 'dns',
-        'nameserver': 'dns',
-    }
-    
-    normalized = type_mapping.get(device_type, device_type)
-    return (normalized, "high")
-
-
-def site_normalize(site: str) -> str:
+    device_type = device_type.strip().lower()
+    return (sys.intern(_TYPE_MAPPING.get(device_type, device_type)), "high")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def site_normalize(site: Optional[str]) -> str:
     """
     Normalize site names to a consistent format.
     Handles variations like "BLR Campus" vs "BLR campus", "HQ Bldg 1" vs "HQ-BUILDING-1"
+    Results are interned so every row for the same site shares one string.
     """
     if not site or site.strip() == "":
         return ""
     
     site = site.strip()
     
-    # Common normalizations
-    normalizations = {
-        'n/a': '',
-        'na': '',
-        'none': '',
-    }
-    
-    site_lower = site.lower()
-    if site_lower in normalizations:
-        return normalizations[site_lower]
-    
-    # Normalize common abbreviations and formats
-    # "BLR Campus" -> "BLR Campus" (keep as is, just standardize case)
-    # "HQ Bldg 1" -> "HQ Bldg 1"
-    # "HQ-BUILDING-1" -> "HQ Building 1"
-    
-    # Replace common variations
-    site = re.sub(r'\b(bldg|building)\b', 'Building', site, flags=re.IGNORECASE)
-    site = re.sub(r'\b(campus|camp)\b', 'Campus', site, flags=re.IGNORECASE)
-    site = re.sub(r'\b(hq|headquarters)\b', 'HQ', site, flags=re.IGNORECASE)
-    
-    # Standardize separators (keep spaces, normalize dashes)
-    site = re.sub(r'\s*-\s*', ' ', site)
-    site = re.sub(r'\s+', ' ', site)
-    
-    # Title case for consistency (but preserve acronyms)
-    words = site.split()
+    # Placeholder values mean "no site"
+    if site.lower() in _SITE_EMPTY:
+        return ""
+    
+    # Single pass over space/dash separated tokens:
+    # "HQ-BUILDING-1" -> "HQ Building 1", "BLR campus" -> "BLR Campus"
     normalized_words = []
-    for word in words:
-        if word.isupper() and len(word) <= 4:  # Preserve acronyms like HQ, BLR, DC
+    for word in _SITE_SPLIT_RE.split(site):
+        if not word:
+            continue
+        mapped = _SITE_TOKEN_MAP.get(word.lower())
+        if mapped:
+            normalized_words.append(mapped)
+        elif word.isupper() and len(word) <= 4:  # Preserve acronyms like HQ, BLR, DC
             normalized_words.append(word)
         else:
             normalized_words.append(word.capitalize())
     
-    return ' '.join(normalized_words)
+    return sys.intern(' '.join(normalized_words))
+
+
+# Precomputed "<field>_invalid_<reason>" step names, keyed by validator reason
+_DNS_NAME_REASONS = (
+    "not_fqdn", "too_long", "invalid_chars", "label_too_long",
+    "empty_label", "invalid_label_format", "missing_tld",
+)
+_IP_INVALID_STEPS = {
+    reason: f"ip_invalid_{reason}" for reason in (
+        "missing", "ipv6_or_non_ipv4", "wrong_part_count", "empty_octet",
+        "non_numeric_or_negative", "non_decimal_format", "octet_out_of_range",
+    )
+}
+_HOSTNAME_INVALID_STEPS = {reason: f"hostname_invalid_{reason}" for reason in _DNS_NAME_REASONS}
+_FQDN_INVALID_STEPS = {reason: f"fqdn_invalid_{reason}" for reason in _DNS_NAME_REASONS}
+_MAC_INVALID_STEPS = {
+    reason: f"mac_invalid_{reason}" for reason in ("wrong_length", "invalid_chars")
+}
+
+
+# Memoized per-field normalizers (all pure functions of their string inputs)
+_CACHED_VALIDATORS = (
+    hostname_validate, fqdn_validate, mac_validate_and_normalize,
+    device_type_classify, site_normalize,
+)
+
+
+def _process_row(row: List[str], cols: Tuple[int, ...], steps: List[str]) -> Tuple[tuple, Optional[Dict]]:
+    """
+    Validate and normalize a single input row.
+    cols holds the input row width followed by the column index of each
+    source field (see process_comprehensive). steps is a scratch list owned
+    by the caller and reused across rows; it is cleared here.
+    Returns: (out_row in fieldnames order, anomaly record or None)
+    """
+    (n_cols, SRI_I, IP_I, HOST_I, FQDN_I, MAC_I,
+     OWNER_I, DT_I, NOTES_I, SITE_I) = cols
+    if len(row) < n_cols:
+        row.extend([""] * (n_cols - len(row)))
+    
+    source_row_id = row[SRI_I]
+    steps.clear()
+    row_anomalies = []
+    
+    # IP validation
+    raw_ip = row[IP_I]
+    ip_valid, ip_canonical, ip_reason = ipv4_validate_and_normalize(raw_ip)
+    steps.append("ip_trim")
+    
+    if ip_valid:
+        steps.append("ip_parse")
+        steps.append("ip_normalize")
+        ip_out = ip_canonical
+        ip_version = "4"
+        subnet_cidr = sys.intern(default_subnet(ip_out))
+    else:
+        ip_out = str(raw_ip).strip()
+        ip_version = ""
+        subnet_cidr = ""
+        steps.append(_IP_INVALID_STEPS[ip_reason])
+        row_anomalies.append({"field": "ip", "type": ip_reason, "value": raw_ip})
+    
+    # Hostname validation
+    raw_hostname = row[HOST_I]
+    hostname_valid, hostname_normalized, hostname_reason = hostname_validate(raw_hostname)
+    if hostname_valid:
+        steps.append("hostname_validate")
+        hostname_out = hostname_normalized
+    else:
+        hostname_out = raw_hostname
+        if hostname_reason != "missing":
+            steps.append(_HOSTNAME_INVALID_STEPS[hostname_reason])
+            row_anomalies.append({"field": "hostname", "type": hostname_reason, "value": raw_hostname})
+    
+    # FQDN validation
+    raw_fqdn = row[FQDN_I]
+    fqdn_valid, fqdn_normalized, fqdn_reason = fqdn_validate(raw_fqdn)
+    if fqdn_valid:
+        steps.append("fqdn_validate")
+        fqdn_out = fqdn_normalized
+    else:
+        fqdn_out = raw_fqdn
+        if fqdn_reason != "missing":
+            steps.append(_FQDN_INVALID_STEPS[fqdn_reason])
+            row_anomalies.append({"field": "fqdn", "type": fqdn_reason, "value": raw_fqdn})
+    
+    # FQDN consistency check
+    # (only meaningful when both names validated and are normalized)
+    fqdn_consistent_flag = hostname_valid and fqdn_valid and fqdn_consistent(hostname_out, fqdn_out)
+    if fqdn_consistent_flag:
+        steps.append("fqdn_consistency_check")
+    
+    # Reverse PTR
+    reverse_ptr = reverse_ptr_from_canonical(ip_canonical) if ip_valid else ""
+    if reverse_ptr:
+        steps.append("reverse_ptr_generate")
+    
+    # MAC validation
+    raw_mac = row[MAC_I]
+    mac_valid, mac_normalized, mac_reason = mac_validate_and_normalize(raw_mac)
+    if mac_valid:
+        steps.append("mac_normalize")
+        mac_out = mac_normalized
+    else:
+        mac_out = raw_mac
+        if mac_reason != "missing":
+            steps.append(_MAC_INVALID_STEPS[mac_reason])
+            row_anomalies.append({"field": "mac", "type": mac_reason, "value": raw_mac})
+    
+    # Owner parsing
+    raw_owner = row[OWNER_I]
+    owner_name, owner_email, owner_team = owner_parse(raw_owner)
+    if owner_name or owner_email or owner_team:
+        steps.append("owner_parse")
+    
+    # Device type classification
+    raw_device_type = row[DT_I]
+    raw_notes = row[NOTES_I]
+    device_type_out, device_type_confidence = device_type_classify(
+        raw_device_type, raw_hostname, raw_notes
+    )
+    if device_type_out:
+        steps.append("device_type_classify")
+    
+    # Site normalization
+    raw_site = row[SITE_I]
+    site_normalized_out = site_normalize(raw_site)
+    if site_normalized_out:
+        steps.append("site_normalize")
+    
+    # Build output row (same order as fieldnames)
+    out_row = (
+        ip_out,
+        _TRUE if ip_valid else _FALSE,
+        ip_version,
+        subnet_cidr,
+        hostname_out,
+        _TRUE if hostname_valid else _FALSE,
+        fqdn_out,
+        _TRUE if fqdn_consistent_flag else _FALSE,
+        reverse_ptr,
+        mac_out,
+        _TRUE if mac_valid else _FALSE,
+        owner_name,
+        owner_email,
+        owner_team,
+        device_type_out,
+        device_type_confidence,
+        raw_site,  # Keep original
+        site_normalized_out,
+        source_row_id,
+        "|".join(steps),
+    )
+    
+    # Add to anomalies if there are issues
+    anomaly = None
+    if row_anomalies:
+        anomaly = {
+            "source_row_id": source_row_id,
+            "issues": row_anomalies,
+            "recommended_actions": ["Review and correct invalid fields"]
+        }
+    
+    return (out_row, anomaly)
 
 
-def process_comprehensive(input_csv: str, out_csv: str, anomalies_json: str):
+def _process_chunk(batch: Tuple[Tuple[int, ...], List[List[str]]]) -> List[Tuple[tuple, Optional[Dict]]]:
+    """
+    Process a batch of input rows; the unit of work handed to pool workers.
+    """
+    cols, rows = batch
+    process_row = _process_row  # local binding keeps global lookups out of the loop
+    steps: List[str] = []  # per-call scratch buffer, safe across concurrent callers
+    return [process_row(row, cols, steps) for row in rows if row]
+
+
+def _available_cpus() -> int:
+    """
+    Number of CPUs this process may run on (honours affinity masks / cgroups
+    where the platform exposes them).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _read_batches(reader: Iterator[List[str]], cols: Tuple[int, ...]) -> Iterator[Tuple[Tuple[int, ...], List[List[str]]]]:
+    """
+    Yield (cols, rows) batches of up to _CHUNK_ROWS rows.
+    Rows are read and parsed on a background thread into a bounded queue so
+    file I/O and CSV parsing overlap with row processing. Closing the
+    generator stops and joins the thread; it must be iterated and closed
+    from the same (calling) thread.
+    """
+    batch_queue = queue.Queue(maxsize=_READ_AHEAD)
+    stop = threading.Event()
+    errors = []
+    
+    def produce():
+        try:
+            for rows in iter(lambda: list(islice(reader, _CHUNK_ROWS)), []):
+                if stop.is_set():
+                    break
+                batch_queue.put(rows)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            batch_queue.put(None)
+    
+    thread = threading.Thread(target=produce, name="csv-reader", daemon=True)
+    thread.start()
+    try:
+        while (rows := batch_queue.get()) is not None:
+            yield (cols, rows)
+    finally:
+        # Unblock a producer waiting on a full queue, then wait for it to exit
+        # so it never touches the input file after the caller closes it
+        stop.set()
+        while thread.is_alive():
+            try:
+                batch_queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        thread.join()
+    
+    # Surface reader failures (e.g. csv.Error) in the calling thread
+    if errors:
+        raise errors[0]
+
+
+def _imap_ordered(pool: Pool, batches: Iterator, window: int) -> Iterator[List[Tuple[tuple, Optional[Dict]]]]:
+    """
+    Ordered equivalent of pool.imap(_process_chunk, batches), except that
+    batches are pulled on the calling thread (never on a pool helper thread)
+    and at most `window` chunks are in flight at once.
+    """
+    pending = deque()
+    for batch in batches:
+        pending.append(pool.apply_async(_process_chunk, (batch,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def process_comprehensive(input_csv: str, out_csv: str, anomalies_json: str,
+                          workers: Optional[int] = None):
     """
     Comprehensive processing function that handles all fields in the target schema.
+    Rows are processed in chunks of _CHUNK_ROWS; inputs larger than one chunk
+    are spread across a process pool of `workers` processes (default: CPUs
+    available to this process; 1 disables the pool). Output order always matches input order.
+    Anomalies are streamed to anomalies_json as they are found, as a JSON
+    array with one record per line.
     """
-    anomalies = []
     prompts_log = []
     
-    with open(input_csv, newline="") as f, open(out_csv, "w", newline="") as g:
-        reader = csv.DictReader(f)
+    with open(input_csv, "r", buffering=_IO_BUFFER, newline="") as f, \
+            open(out_csv, "w", buffering=_IO_BUFFER, newline="") as g, \
+            open(anomalies_json, "w", buffering=_IO_BUFFER) as h:
+        # Input is read front to back once; let the kernel read ahead aggressively
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        
+        reader = csv.reader(f)
+        header = next(reader, [])
+        
+        # Resolve input column positions once; absent columns point at the
+        # trailing empty pad cell appended to every row
+        col = {name: i for i, name in enumerate(header)}
+        cols = (len(header) + 1,) + tuple(
+            col.get(name, len(header)) for name in (
+                "source_row_id", "ip", "hostname", "fqdn", "mac",
+                "owner", "device_type", "notes", "site",
+            )
+        )
         
         # Target schema fields
         fieldnames = [
@@ -296,137 +635,57 @@ def process_comprehensive(input_csv: str, out_csv: str, anomalies_json: str):
             "source_row_id", "normalization_steps"
         ]
         
-        writer = csv.DictWriter(g, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(g)
+        writer.writerow(fieldnames)
         
-        for row in reader:
-            source_row_id = row.get("source_row_id", "")
-            steps = []
-            row_anomalies = []
-            
-            # IP validation
-            raw_ip = row.get("ip", "")
-            ip_valid, ip_canonical, ip_reason = ipv4_validate_and_normalize(raw_ip)
-            steps.append("ip_trim")
-            
-            if ip_valid:
-                steps.append("ip_parse")
-                steps.append("ip_normalize")
-                ip_out = ip_canonical
-                ip_version = "4"
-                subnet_cidr = default_subnet(ip_out)
-            else:
-                ip_out = str(raw_ip).strip()
-                ip_version = ""
-                subnet_cidr = ""
-                steps.append(f"ip_invalid_{ip_reason}")
-                row_anomalies.append({"field": "ip", "type": ip_reason, "value": raw_ip})
-            
-            # Hostname validation
-            raw_hostname = row.get("hostname", "")
-            hostname_valid, hostname_normalized, hostname_reason = hostname_validate(raw_hostname)
-            if hostname_valid:
-                steps.append("hostname_validate")
-                hostname_out = hostname_normalized
-            else:
-                hostname_out = raw_hostname
-                if hostname_reason != "missing":
-                    steps.append(f"hostname_invalid_{hostname_reason}")
-                    row_anomalies.append({"field": "hostname", "type": hostname_reason, "value": raw_hostname})
-            
-            # FQDN validation
-            raw_fqdn = row.get("fqdn", "")
-            fqdn_valid, fqdn_normalized, fqdn_reason = fqdn_validate(raw_fqdn)
-            if fqdn_valid:
-                steps.append("fqdn_validate")
-                fqdn_out = fqdn_normalized
-            else:
-                fqdn_out = raw_fqdn
-                if fqdn_reason != "missing":
-                    steps.append(f"fqdn_invalid_{fqdn_reason}")
-                    row_anomalies.append({"field": "fqdn", "type": fqdn_reason, "value": raw_fqdn})
-            
-            # FQDN consistency check
-            fqdn_consistent_flag = fqdn_consistent(hostname_out, fqdn_out, ip_out)
-            if fqdn_consistent_flag:
-                steps.append("fqdn_consistency_check")
-            
-            # Reverse PTR
-            reverse_ptr = reverse_ptr_generate(ip_out) if ip_valid else ""
-            if reverse_ptr:
-                steps.append("reverse_ptr_generate")
-            
-            # MAC validation
-            raw_mac = row.get("mac", "")
-            mac_valid, mac_normalized, mac_reason = mac_validate_and_normalize(raw_mac)
-            if mac_valid:
-                steps.append("mac_normalize")
-                mac_out = mac_normalized
+        # Read the first two chunks synchronously: they decide whether a pool
+        # is worth starting, and the pool must fork before the reader thread
+        # exists (forking a threaded process can deadlock the children)
+        head = [(cols, rows) for rows in islice(iter(lambda: list(islice(reader, _CHUNK_ROWS)), []), 2)]
+        
+        # Only pay for worker start-up when there is more than one chunk and
+        # more than one CPU to spread it over
+        workers = workers or _available_cpus()
+        pool = None
+        if len(head) > 1 and workers > 1:
+            pool = Pool(workers)
+        
+        # Fewer than two chunks means the input is already exhausted
+        batches = _read_batches(reader, cols) if len(head) > 1 else None
+        # Bind hot-loop methods to locals (cheaper for CPython, simpler traces for PyPy)
+        writerow = writer.writerow
+        write = h.write
+        dumps = json.dumps
+        
+        write("[")
+        sep = "\n"
+        try:
+            if pool:
+                results = _imap_ordered(pool, chain(head, batches or ()), 2 * workers)
             else:
-                mac_out = raw_mac
-                if mac_reason != "missing":
-                    steps.append(f"mac_invalid_{mac_reason}")
-                    row_anomalies.append({"field": "mac", "type": mac_reason, "value": raw_mac})
-            
-            # Owner parsing
-            raw_owner = row.get("owner", "")
-            owner_name, owner_email, owner_team = owner_parse(raw_owner)
-            if owner_name or owner_email or owner_team:
-                steps.append("owner_parse")
-            
-            # Device type classification
-            raw_device_type = row.get("device_type", "")
-            raw_hostname_for_type = row.get("hostname", "")
-            raw_notes = row.get("notes", "")
-            device_type_out, device_type_confidence = device_type_classify(
-                raw_device_type, raw_hostname_for_type, raw_notes
-            )
-            if device_type_out:
-                steps.append("device_type_classify")
-            
-            # Site normalization
-            raw_site = row.get("site", "")
-            site_normalized_out = site_normalize(raw_site)
-            if site_normalized_out:
-                steps.append("site_normalize")
-            
-            # Build output row
-            out_row = {
-                "ip": ip_out,
-                "ip_valid": "true" if ip_valid else "false",
-                "ip_version": ip_version,
-                "subnet_cidr": subnet_cidr,
-                "hostname": hostname_out,
-                "hostname_valid": "true" if hostname_valid else "false",
-                "fqdn": fqdn_out,
-                "fqdn_consistent": "true" if fqdn_consistent_flag else "false",
-                "reverse_ptr": reverse_ptr,
-                "mac": mac_out,
-                "mac_valid": "true" if mac_valid else "false",
-                "owner": owner_name,
-                "owner_email": owner_email,
-                "owner_team": owner_team,
-                "device_type": device_type_out,
-                "device_type_confidence": device_type_confidence,
-                "site": raw_site,  # Keep original
-                "site_normalized": site_normalized_out,
-                "source_row_id": source_row_id,
-                "normalization_steps": "|".join(steps)
-            }
-            
-            writer.writerow(out_row)
-            
-            # Add to anomalies if there are issues
-            if row_anomalies:
-                anomalies.append({
-                    "source_row_id": source_row_id,
-                    "issues": row_anomalies,
-                    "recommended_actions": ["Review and correct invalid fields"]
-                })
-    
-    # Write anomalies
-    with open(anomalies_json, "w") as h:
-        json.dump(anomalies, h, indent=2)
+                results = map(_process_chunk, chain(head, batches or ()))
+            for chunk in results:
+                for out_row, anomaly in chunk:
+                    writerow(out_row)
+                    if anomaly:
+                        write(sep)
+                        write(dumps(anomaly, separators=(",", ":")))
+                        sep = ",\n"
+        finally:
+            # Stop the workers first, then the reader; each runs even if the
+            # other fails. Both are driven from this thread only.
+            try:
+                if pool:
+                    pool.terminate()
+                    pool.join()
+            finally:
+                if batches:
+                    batches.close()
+        write("\n]\n" if sep != "\n" else "]\n")
+    
+    # Release memoized results so they do not outlive this run
+    for func in _CACHED_VALIDATORS:
+        func.cache_clear()
     
     return prompts_log
 
@@ -3,13 +3,15 @@
 Main orchestrator for inventory data processing pipeline.
 Processes inventory_raw.csv through comprehensive validation and normalization.
 """
-import subprocess
 import sys
 from pathlib import Path
 
 HERE = Path(__file__).parent
 PROJECT_ROOT = HERE.parent
 
+sys.path.insert(0, str(HERE))
+from data_processor import process_comprehensive
+
 def main():
     """Run the comprehensive data processing pipeline."""
     input_csv = PROJECT_ROOT / "inventory_raw.csv"
@@ -18,11 +20,7 @@ def main():
     
     # Run comprehensive processing
     print("Starting comprehensive data processing...")
-    subprocess.check_call([
-        sys.executable,
-        str(HERE / "data_processor.py"),
-        str(input_csv)
-    ])
+    process_comprehensive(str(input_csv), str(output_csv), str(anomalies_json))
     
     print(f"✓ Processing complete!")
     print(f"  - Output: {output_csv}")